@@ -0,0 +1,52 @@
+# Importing the model modules registers their tables on the shared Base.metadata
+import models.users  # noqa: F401
+import models.events  # noqa: F401
+import models.orders  # noqa: F401
+import models.tickets  # noqa: F401
+from sqlalchemy import text
+from database import engine, Base
+
+# Unique constraints added after the tables first shipped; create_all never alters existing tables
+_UNIQUE_CONSTRAINTS = (
+    ("ticket_types", "uq_ticket_types_event_name", "event_id, name"),
+    ("tickets", "uq_tickets_order_ticket_type", "order_id, ticket_type_id"),
+)
+
+# Only columns the routes filter on stay indexed; drop the old per-column indexes everywhere else
+_DROPPED_INDEXES = (
+    "ix_users_firstname", "ix_users_surname", "ix_users_password", "ix_users_phone_number",
+    "ix_users_street_address", "ix_events_description", "ix_events_location", "ix_events_date",
+    "ix_events_image", "ix_orders_order_date", "ix_orders_total_price", "ix_orders_payment_method",
+    "ix_orders_payment_status", "ix_ticket_types_name", "ix_ticket_types_description",
+    "ix_ticket_types_price", "ix_ticket_types_quantity", "ix_tickets_seat_number", "ix_tickets_qr_code",
+)
+
+
+def init_db():
+    with engine.begin() as conn:
+        # Serialise workers booting together so only one of them emits the DDL
+        conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('schema_init'))"))
+        Base.metadata.create_all(bind=conn, checkfirst=True)
+
+
+def migrate_db():
+    # Run explicitly, not at boot: adding a constraint fails if the table already holds duplicates
+    with engine.begin() as conn:
+        conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('schema_init'))"))
+        for table, name, columns in _UNIQUE_CONSTRAINTS:
+            exists = conn.execute(
+                text("SELECT 1 FROM pg_constraint WHERE conname = :name AND conrelid = CAST(:table AS regclass)"),
+                {"name": name, "table": table},
+            ).first()
+            if not exists:
+                conn.execute(text(f"ALTER TABLE {table} ADD CONSTRAINT {name} UNIQUE ({columns})"))
+
+        # Backs create_order's duplicate check
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_orders_user_date ON orders (user_id, order_date)"))
+        for name in _DROPPED_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+
+if __name__ == "__main__":
+    init_db()
+    migrate_db()
@@ -1,11 +1,36 @@
+import atexit
+import logging
+
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from init_db import init_db
 from routers import users, events, orders, tickets
 
+# Set up logging: request threads only enqueue records, the listener thread does the stream I/O
+log_queue = SimpleQueue()
+log_listener = QueueListener(log_queue, logging.StreamHandler())
+log_listener.start()
+atexit.register(log_listener.stop)
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await run_in_threadpool(init_db)
+    yield
+
 
 app = FastAPI(
     title="Ticket Pro ZW",
     description="Ticket Pro ZW API",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 app.include_router(users.router)
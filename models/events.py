@@ -7,9 +7,9 @@ class Events(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     event_name = Column(String, index=True)
-    description = Column(String, index=True)
+    description = Column(String)
     organizer_id = Column(Integer, ForeignKey("users.id"))
-    location = Column(String, index=True)
-    date = Column(DateTime, index=True)
-    image = Column(String, index=True)
+    location = Column(String)
+    date = Column(DateTime)
+    image = Column(String)
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, Float
+from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, Float, Index
 from database import Base
 
 
@@ -8,8 +8,12 @@ class Orders(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
     event_id = Column(Integer, ForeignKey("events.id"))
-    order_date = Column(DateTime, index=True)
-    total_price = Column(Float, index=True)
-    payment_method = Column(String, index=True)
-    payment_status = Column(String, index=True)
+    order_date = Column(DateTime)
+    total_price = Column(Float)
+    payment_method = Column(String)
+    payment_status = Column(String)
+
+    __table_args__ = (
+        Index('ix_orders_user_date', user_id, order_date),
+    )
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, Float
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, Float, UniqueConstraint
 from database import Base
 
 
@@ -7,10 +7,14 @@ class TicketTypes(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     event_id = Column(Integer, ForeignKey("events.id"))
-    name = Column(String, index=True)
-    description = Column(String, index=True)
-    price = Column(Float, index=True)
-    quantity = Column(Integer, index=True)
+    name = Column(String)
+    description = Column(String)
+    price = Column(Float)
+    quantity = Column(Integer)
+
+    __table_args__ = (
+        UniqueConstraint(event_id, name, name='uq_ticket_types_event_name'),
+    )
 
 
 class Tickets(Base):
@@ -19,7 +23,11 @@ class Tickets(Base):
     id = Column(Integer, primary_key=True, index=True)
     order_id = Column(Integer, ForeignKey("orders.id"))
     ticket_type_id = Column(Integer, ForeignKey("ticket_types.id"))
-    seat_number = Column(String, index=True)
-    qr_code = Column(String, index=True)
+    seat_number = Column(String)
+    qr_code = Column(String)
     checked_in = Column(Boolean, default=False)
     checked_out = Column(Boolean, default=False)
+
+    __table_args__ = (
+        UniqueConstraint(order_id, ticket_type_id, name='uq_tickets_order_ticket_type'),
+    )
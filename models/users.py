@@ -6,11 +6,11 @@ class Users(Base):
     __tablename__ = 'users'
 
     id = Column(Integer, primary_key=True, index=True)
-    firstname = Column(String, index=True)
-    surname = Column(String, index=True)
+    firstname = Column(String)
+    surname = Column(String)
     email = Column(String, unique=True)
-    password = Column(String, index=True)
-    phone_number = Column(String, index=True)
-    street_address = Column(String, index=True)
+    password = Column(String)
+    phone_number = Column(String)
+    street_address = Column(String)
     active = Column(Boolean, default=True)
 
@@ -1,4 +1,5 @@
 from fastapi import APIRouter
+from sqlalchemy import exists, insert
 from schemas import events as events_schema
 from models import events as events_model
 from dependencies import db_dependency, HTTPException
@@ -9,26 +10,20 @@ router = APIRouter(
 
 
 @router.get("/{event_id}")
-async def read_event(event_id: int, db: db_dependency):
-    result = db.query(events_model.Events).filter(events_model.Events.id == event_id).first()
+def read_event(event_id: int, db: db_dependency):
+    result = db.get(events_model.Events, event_id)
     if not result:
         raise HTTPException(status_code=404, detail="Event not found")
     return result
 
 
 @router.post("/")
-async def create_event(event: events_schema.EventBase, db: db_dependency):
-    existing_event = db.query(events_model.Events).filter(events_model.Events.event_name == event.event_name).first()
+def create_event(event: events_schema.EventBase, db: db_dependency):
+    existing_event = db.query(exists().where(events_model.Events.event_name == event.event_name)).scalar()
     if existing_event:
         raise HTTPException(status_code=400, detail="Event already exists")
 
-    db_event = events_model.Events(
-        event_name=event.event_name, description=event.description, organizer_id=event.organizer_id,
-        location=event.location, date=event.date, image=event.image
-    )
-    db.add(db_event)
+    # Core insert: nothing reads the new row back, so skip the ORM unit-of-work
+    db.execute(insert(events_model.Events).values(**event.model_dump()))
     db.commit()
-    # Optional: To return the newly created event
-    # db.refresh(db_event)
-    # return db_event
     return {"statusCode": 200, "message": "Event created successfully"}
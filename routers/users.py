@@ -1,6 +1,8 @@
 import logging
 
 from fastapi import APIRouter
+from sqlalchemy import bindparam, exists, select
+from sqlalchemy.dialects.postgresql import insert
 from schemas import users as users_schema
 from models import users as users_model
 from dependencies import db_dependency, HTTPException, verify_password, hash_password
@@ -9,13 +11,15 @@ router = APIRouter(
     prefix="/api/v1/user"
 )
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Built once so the login lookup hits SQLAlchemy's compiled cache without rebuilding the statement
+_SELECT_USER_BY_EMAIL = select(users_model.Users).where(users_model.Users.email == bindparam("email"))
+
+
 @router.post("/auth")
 def authenticate_user(auth_user: users_schema.AuthUserBase, db: db_dependency):
-    user = db.query(users_model.Users).filter(users_model.Users.email == auth_user.username).first()
+    user = db.execute(_SELECT_USER_BY_EMAIL, {"email": auth_user.username}).scalar_one_or_none()
     if not user:
         logger.warning("User not found: %s", auth_user.username)
         raise HTTPException(status_code=404, detail="User not found")
@@ -29,27 +33,27 @@ def authenticate_user(auth_user: users_schema.AuthUserBase, db: db_dependency):
 
 
 @router.get("/{user_id}")
-async def read_user(user_id: int, db: db_dependency):
-    result = db.query(users_model.Users).filter(users_model.Users.id == user_id).first()
+def read_user(user_id: int, db: db_dependency):
+    result = db.get(users_model.Users, user_id)
     if not result:
         raise HTTPException(status_code=404, detail="User not found")
     return result
 
 
 @router.post("/")
-async def create_user(user: users_schema.UserBase, db: db_dependency):
-    existing_user = db.query(users_model.Users).filter(users_model.Users.email == user.email).first()
-    if existing_user:
+def create_user(user: users_schema.UserBase, db: db_dependency):
+    # Reject duplicates before paying for bcrypt; `== None` compiles to IS NULL, so email-less users are covered too
+    if db.query(exists().where(users_model.Users.email == user.email)).scalar():
         raise HTTPException(status_code=400, detail="User already exists")
 
-    db_user = users_model.Users(
-        firstname=user.firstname, surname=user.surname, email=user.email,
-        password=hash_password(user.password),
-        phone_number=user.phone_number, street_address=user.street_address, active=user.active
+    # ON CONFLICT still guards against a concurrent registration of the same address
+    result = db.execute(
+        insert(users_model.Users)
+        .values(**user.model_dump(exclude={"password"}), password=hash_password(user.password))
+        .on_conflict_do_nothing(index_elements=[users_model.Users.email])
     )
-    db.add(db_user)
+    if result.rowcount == 0:
+        raise HTTPException(status_code=400, detail="User already exists")
+
     db.commit()
-    # Optional: To return the newly created user
-    # db.refresh(db_user)
-    # return db_user
     return {"statusCode": 200, "message": "User created successfully"}